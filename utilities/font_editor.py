@@ -9,12 +9,39 @@ Features:
 - Interactive grid for editing characters.
 - Drag-to-paint support.
 - Clear and Invert tools.
+- Uses orjson for faster load/save when it is installed.
 """
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import json
 import os
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Convert between ASCII BitArray rows and binary digit strings ('X' is set, anything else is clear)
+_DECODE = bytes(ord('1') if b == ord('X') else ord('0') for b in range(256))
+_ENCODE = str.maketrans("01", ".X")
+# Turns a binary digit string into a Tk photo color list (the trailing space is ignored by Tcl)
+_COLORS = str.maketrans({"0": "#FFF ", "1": "#000 "})
+
+@lru_cache(maxsize=8)
+def _load_font(path, mtime):
+    # mtime is only part of the cache key, so files changed on disk are parsed again
+    # Read the file in one go and hand the parser a single buffer
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _copy_font(font_data):
+    # save_file only reassigns glyph["BitArray"], so copying the glyph dicts is enough
+    # to keep the cached parse untouched (and far cheaper than a deepcopy)
+    glyphs = {t: [dict(g) for g in font_data[t]] for t in ("LargeGlyphs", "SmallGlyphs") if t in font_data}
+    return {**font_data, **glyphs}
 
 class FontEditor:
     def __init__(self, root):
@@ -23,12 +50,20 @@ class FontEditor:
         self.root.geometry("850x780")
         
         self.font_data = None
+        self.masks = {}
+        self.dirty_glyphs = set()
         self.file_path = None
+        self.resource_dir = None
         self.current_glyph_type = "LargeGlyphs"
         self.current_char_index = -1
+        self.current_mask = None
         self.grid_width = 21
         self.grid_height = 31
         self.cell_size = 18
+        self.canvas_dims = None
+        self.pending_cells = set()
+        self.flush_scheduled = False
+        self.pending_status = None
         
         self.setup_ui()
         
@@ -101,6 +136,14 @@ class FontEditor:
         self.canvas.pack()
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
+        self.canvas.bind("<ButtonRelease-1>", lambda e: self.flush_paint())
+        
+        # The glyph is rendered one pixel per cell into base_img, which Tk zooms into
+        # display_img for the canvas. Both images and the canvas item live for the whole session.
+        self.base_img = tk.PhotoImage()
+        self.display_img = tk.PhotoImage()
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.display_img, tags="img")
+        self.build_canvas()
         
         # Legend
         legend_frame = tk.Frame(right_panel)
@@ -111,28 +154,68 @@ class FontEditor:
         self.status_bar = tk.Label(self.root, text="Ready", bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
+    def build_canvas(self):
+        # Only a change of glyph dimensions resizes the images and redraws the grid lines
+        if self.canvas_dims != (self.grid_width, self.grid_height):
+            self.canvas_dims = (self.grid_width, self.grid_height)
+            # Cell edge coordinates are computed once per grid size: cell c spans xs[c]..xs[c + 1]
+            self.xs = [c * self.cell_size for c in range(self.grid_width + 1)]
+            self.ys = [r * self.cell_size for r in range(self.grid_height + 1)]
+            width = self.xs[-1]
+            height = self.ys[-1]
+            self.canvas.config(width=width, height=height)
+            # Formatted color rows depend on the grid width
+            self.row_cache = {}
+            
+            self.base_img.configure(width=self.grid_width, height=self.grid_height)
+            self.display_img.configure(width=width, height=height)
+            self.canvas.delete("grid")
+            for x in self.xs:
+                self.canvas.create_line(x, 0, x, height, fill="#DDDDDD", tags="grid")
+            for y in self.ys:
+                self.canvas.create_line(0, y, width, y, fill="#DDDDDD", tags="grid")
+        self.canvas.itemconfig("all", state=tk.HIDDEN)
+
     def open_file(self):
-        initial_dir = os.path.join(os.getcwd(), "Resources")
-        if not os.path.exists(initial_dir):
-            initial_dir = os.getcwd()
+        if self.resource_dir is None:
+            cwd = os.getcwd()
+            self.resource_dir = os.path.join(cwd, "Resources")
+            if not os.path.exists(self.resource_dir):
+                self.resource_dir = cwd
             
-        file_path = filedialog.askopenfilename(initialdir=initial_dir, filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+        file_path = filedialog.askopenfilename(initialdir=self.resource_dir, filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
         if not file_path:
             return
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.font_data = json.load(f)
+            # Work on a copy so edits never leak into the cached parse
+            font_data = _copy_font(_load_font(file_path, os.path.getmtime(file_path)))
             
-            self.file_path = file_path
-            self.filename_label.config(text=os.path.basename(file_path), fg="blue")
+            # Grid Dimensions from file if they exist
+            width = font_data.get("GlyphWidth", 21)
+            height = font_data.get("GlyphHeight", 31)
             
-            # Update Grid Dimensions from file if they exist
-            self.grid_width = self.font_data.get("GlyphWidth", 21)
-            self.grid_height = self.font_data.get("GlyphHeight", 31)
+            # Decode every glyph into packed rows; BitArray strings are only rebuilt on save.
+            # This happens before any editor state changes, so a bad file leaves the current font intact.
+            masks = {}
+            for glyph_type in ("LargeGlyphs", "SmallGlyphs"):
+                if glyph_type in font_data:
+                    masks[glyph_type] = [self.decode_glyph(g.get("BitArray", []), width, height) for g in font_data[glyph_type]]
+            
+            self.font_data = font_data
+            self.masks = masks
+            self.dirty_glyphs.clear()
+            self.current_char_index = -1
+            self.current_mask = None
+            self.grid_width = width
+            self.grid_height = height
+            
+            self.file_path = file_path
+            base_name = os.path.basename(file_path)
+            self.filename_label.config(text=base_name, fg="blue")
             
             # Refresh UI Canvas size
-            self.canvas.config(width=self.grid_width * self.cell_size, height=self.grid_height * self.cell_size)
+            self.build_canvas()
             
             types = []
             if "LargeGlyphs" in self.font_data: types.append("LargeGlyphs")
@@ -145,17 +228,35 @@ class FontEditor:
                     self.glyph_type_var.set(self.current_glyph_type)
             
             self.update_char_list()
-            self.set_status(f"Loaded {os.path.basename(file_path)}")
+            self.set_status(f"Loaded {base_name}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load font: {e}")
 
+    def decode_glyph(self, bit_array, width, height):
+        # Each row is packed into one int; the leftmost pixel is the most significant bit.
+        # Rows are padded/truncated here once, so the editing code can assume a full grid.
+        rows = [int(row.encode('ascii', 'replace')[:width].ljust(width, b'.').translate(_DECODE), 2) for row in bit_array[:height]]
+        rows.extend([0] * (height - len(rows)))
+        return rows
+
+    def encode_glyph(self, mask):
+        return [format(bits, f"0{self.grid_width}b").translate(_ENCODE) for bits in mask]
+
     def set_status(self, text):
-        self.status_bar.config(text=text)
+        # Only the latest text of a burst of updates reaches the label
+        if self.pending_status is None:
+            self.root.after_idle(self.apply_status)
+        self.pending_status = text
+
+    def apply_status(self):
+        self.status_bar.config(text=self.pending_status)
+        self.pending_status = None
 
     def on_type_change(self, event):
         self.current_glyph_type = self.glyph_type_var.get()
         self.update_char_list()
         self.current_char_index = -1
+        self.current_mask = None
         self.draw_grid()
 
     def update_char_list(self):
@@ -176,31 +277,41 @@ class FontEditor:
             return
             
         self.current_char_index = selection[0]
+        # Edits go through this reference; every operation mutates the mask in place
+        self.current_mask = self.masks[self.current_glyph_type][self.current_char_index]
+        assert len(self.current_mask) == self.grid_height
         char = self.font_data[self.current_glyph_type][self.current_char_index].get("Character", "")
         if char == " ": char = "SPACE"
         self.char_display_label.config(text=f"Editing: '{char}'")
         self.draw_grid()
         
     def draw_grid(self):
-        self.canvas.delete("all")
         if self.current_char_index < 0:
+            self.canvas.itemconfig("all", state=tk.HIDDEN)
             return
             
-        glyph = self.font_data[self.current_glyph_type][self.current_char_index]
-        bit_array = glyph.get("BitArray", [])
+        mask = self.current_mask
+        self.pending_cells.clear()
+        
+        # The whole glyph goes to Tk as one put: one {...} list of colors per row.
+        # Rows are cached by their packed value, so edits never need invalidation.
+        row_cache = self.row_cache
+        rows = []
+        for bits in mask:
+            row = row_cache.get(bits)
+            if row is None:
+                row = "{" + format(bits, f"0{self.grid_width}b").translate(_COLORS) + "}"
+                row_cache[bits] = row
+            rows.append(row)
+        data = " ".join(rows)
+        self.base_img.put(data, to=(0, 0))
+        self.refresh_display()
         
-        for r in range(self.grid_height):
-            line = bit_array[r] if r < len(bit_array) else "." * self.grid_width
-            for c in range(self.grid_width):
-                char = line[c] if c < len(line) else "."
-                color = "black" if char == 'X' else "white"
-                
-                x1 = c * self.cell_size
-                y1 = r * self.cell_size
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="#DDDDDD", tags=f"cell_{r}_{c}")
+        self.canvas.itemconfig("all", state=tk.NORMAL)
+
+    def refresh_display(self):
+        # Nearest-neighbour upscaling of base_img is done by Tk's photo "copy -zoom"
+        self.display_img.tk.call(self.display_img, "copy", self.base_img, "-zoom", self.cell_size, self.cell_size)
 
     def on_canvas_click(self, event):
         self.last_drag_cell = None
@@ -221,104 +332,96 @@ class FontEditor:
             if hasattr(self, 'last_drag_cell') and mode == "paint" and self.last_drag_cell == (row, col):
                 return
             
-            glyph = self.font_data[self.current_glyph_type][self.current_char_index]
-            bit_array = glyph.get("BitArray", [])
-            
-            # Pad bit_array if it's shorter than grid_height
-            while len(bit_array) < self.grid_height:
-                bit_array.append("." * self.grid_width)
-            
-            line = list(bit_array[row])
-            # Pad line if it's shorter than grid_width
-            while len(line) < self.grid_width:
-                line.append(".")
+            mask = self.current_mask
+            bit = 1 << (self.grid_width - 1 - col)
+            old_bits = mask[row]
             
             if mode == "toggle":
-                line[col] = 'X' if line[col] == '.' else '.'
-                self.paint_val = line[col]
+                mask[row] ^= bit
+                self.paint_val = bool(mask[row] & bit)
             else: # paint mode
-                if hasattr(self, 'paint_val'):
-                    line[col] = self.paint_val
+                if getattr(self, 'paint_val', True):
+                    mask[row] |= bit
                 else:
-                    line[col] = 'X'
-            
-            bit_array[row] = "".join(line)
-            glyph["BitArray"] = bit_array
+                    mask[row] &= ~bit
             
             self.last_drag_cell = (row, col)
+            # Painting over cells that already have the paint value changes nothing
+            if mask[row] == old_bits:
+                return
+            self.dirty_glyphs.add((self.current_glyph_type, self.current_char_index))
             
-            color = "black" if line[col] == 'X' else "white"
-            self.canvas.itemconfig(f"cell_{row}_{col}", fill=color)
+            # Motion events arrive faster than Tk repaints, so batch the bitmap updates
+            self.pending_cells.add((row, col))
+            if not self.flush_scheduled:
+                self.flush_scheduled = True
+                self.root.after_idle(self.flush_paint)
+
+    def flush_paint(self):
+        self.flush_scheduled = False
+        if self.current_char_index >= 0:
+            mask = self.current_mask
+            xs, ys = self.xs, self.ys
+            for row, col in self.pending_cells:
+                color = "#000" if mask[row] >> (self.grid_width - 1 - col) & 1 else "#FFF"
+                self.base_img.put(color, to=(col, row))
+                # Zoom just this cell into the display image instead of the whole glyph
+                self.display_img.tk.call(self.display_img, "copy", self.base_img,
+                                         "-from", col, row, col + 1, row + 1,
+                                         "-to", xs[col], ys[row],
+                                         "-zoom", self.cell_size, self.cell_size)
+        self.pending_cells.clear()
 
     def clear_grid(self):
         if self.current_char_index < 0: return
         if not messagebox.askyesno("Confirm", "Are you sure you want to clear this glyph?"): return
-        glyph = self.font_data[self.current_glyph_type][self.current_char_index]
-        glyph["BitArray"] = ["." * self.grid_width for _ in range(self.grid_height)]
-        self.draw_grid()
+        self.current_mask[:] = [0] * self.grid_height
+        self.dirty_glyphs.add((self.current_glyph_type, self.current_char_index))
+        # A cleared glyph is a single fill; no need to walk the mask again
+        self.pending_cells.clear()
+        self.base_img.put("#FFF", to=(0, 0, self.grid_width, self.grid_height))
+        self.refresh_display()
 
     def invert_grid(self):
         if self.current_char_index < 0: return
-        glyph = self.font_data[self.current_glyph_type][self.current_char_index]
-        bit_array = glyph.get("BitArray", [])
-        new_bit_array = []
-        for row in bit_array:
-            # Handle potential mismatch in lengths
-            while len(row) < self.grid_width: row += "."
-            new_row = "".join(['.' if c == 'X' else 'X' for c in row[:self.grid_width]])
-            new_bit_array.append(new_row)
-        
-        # Pad to full height if necessary
-        while len(new_bit_array) < self.grid_height:
-            new_bit_array.append("X" * self.grid_width)
-            
-        glyph["BitArray"] = new_bit_array
+        mask = self.current_mask
+        full = (1 << self.grid_width) - 1
+        mask[:] = [bits ^ full for bits in mask]
+        self.dirty_glyphs.add((self.current_glyph_type, self.current_char_index))
         self.draw_grid()
 
     def shift_grid(self, dx, dy):
         if self.current_char_index < 0: return
-        glyph = self.font_data[self.current_glyph_type][self.current_char_index]
-        bit_array = glyph.get("BitArray", [])
-        
-        # Ensure bit_array is normalized to grid dimensions
-        while len(bit_array) < self.grid_height:
-            bit_array.append("." * self.grid_width)
-        
-        normalized_bit_array = []
-        for row in bit_array:
-            if len(row) < self.grid_width:
-                row = row.ljust(self.grid_width, ".")
-            normalized_bit_array.append(row[:self.grid_width])
-        
-        bit_array = normalized_bit_array
+        mask = self.current_mask
 
         if dx != 0:
             # Check for clipping
             if dx > 0: # Shift right
-                if any(row[-1] == 'X' for row in bit_array):
+                if any(bits & 1 for bits in mask):
                     self.set_status("Cannot shift right: clipping detected")
                     return
-                bit_array = ["." + row[:-1] for row in bit_array]
+                mask[:] = [bits >> 1 for bits in mask]
             else: # Shift left
-                if any(row[0] == 'X' for row in bit_array):
+                left = 1 << (self.grid_width - 1)
+                if any(bits & left for bits in mask):
                     self.set_status("Cannot shift left: clipping detected")
                     return
-                bit_array = [row[1:] + "." for row in bit_array]
+                mask[:] = [bits << 1 for bits in mask]
         
         if dy != 0:
             # Check for clipping
             if dy > 0: # Shift down
-                if 'X' in bit_array[-1]:
+                if mask[-1]:
                     self.set_status("Cannot shift down: clipping detected")
                     return
-                bit_array = ["." * self.grid_width] + bit_array[:-1]
+                mask[:] = [0] + mask[:-1]
             else: # Shift up
-                if 'X' in bit_array[0]:
+                if mask[0]:
                     self.set_status("Cannot shift up: clipping detected")
                     return
-                bit_array = bit_array[1:] + ["." * self.grid_width]
+                mask[:] = mask[1:] + [0]
 
-        glyph["BitArray"] = bit_array
+        self.dirty_glyphs.add((self.current_glyph_type, self.current_char_index))
         self.draw_grid()
         self.set_status(f"Shifted {' '.join([('Right' if dx>0 else 'Left') if dx!=0 else '', ('Down' if dy>0 else 'Up') if dy!=0 else ''])}")
 
@@ -326,10 +429,23 @@ class FontEditor:
         if not self.font_data or not self.file_path:
             messagebox.showwarning("Warning", "No font data to save.")
             return
+        if not self.dirty_glyphs:
+            self.set_status("No changes to save")
+            return
             
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.font_data, f, indent=2, ensure_ascii=False)
+            # Glyphs that were never edited still hold their original BitArray strings
+            for glyph_type, index in self.dirty_glyphs:
+                self.font_data[glyph_type][index]["BitArray"] = self.encode_glyph(self.masks[glyph_type][index])
+            
+            if orjson:
+                with open(self.file_path, 'wb') as f:
+                    f.write(orjson.dumps(self.font_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.file_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.font_data, f, indent=2, ensure_ascii=False)
+            _load_font.cache_clear()
+            self.dirty_glyphs.clear()
             self.set_status(f"Successfully saved to {os.path.basename(self.file_path)}")
             messagebox.showinfo("Success", f"Font saved to {self.file_path}")
         except Exception as e: